@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Optional color management for generated screenshots (sRGB / Display P3)"""
+
+import io
+import os
+import struct
+
+from PIL import ImageCms
+
+# Screens are drawn with sRGB values; these are the supported output spaces
+COLOR_SPACES = ("srgb", "p3")
+
+# A system Display P3 profile is preferred when one exists; otherwise
+# build_p3_profile() synthesizes an equivalent one
+P3_PROFILE_PATHS = [
+    os.environ.get("DISPLAY_P3_ICC", ""),
+    "/System/Library/ColorSync/Profiles/Display P3.icc",
+    "/Library/ColorSync/Profiles/Display P3.icc",
+    "/usr/share/color/icc/DisplayP3.icc",
+    "/usr/share/color/icc/colord/DisplayP3.icc",
+]
+
+# Display P3 colorants adapted to D50 (Bradford), the D50 PCS white point,
+# the D65 -> D50 chromatic adaptation, and the sRGB transfer curve
+P3_XYZ = {
+    b"rXYZ": (0.515102, 0.241182, -0.001050),
+    b"gXYZ": (0.291965, 0.692236, 0.041882),
+    b"bXYZ": (0.157153, 0.066583, 0.784378),
+}
+D50 = (0.964203, 1.0, 0.824905)
+CHAD = (1.047882, 0.022918, -0.050217,
+        0.029586, 0.990478, -0.017075,
+        -0.009233, 0.015075, 0.751678)
+SRGB_TRC = (2.4, 1 / 1.055, 0.055 / 1.055, 1 / 12.92, 0.04045)
+
+# Built once per process: (transform or None, embedded ICC bytes) per space
+_stages = {}
+
+def find_p3_profile():
+    """Path of a Display P3 profile on disk, or None"""
+    for p in P3_PROFILE_PATHS:
+        if p and os.path.exists(p):
+            return p
+    if os.environ.get("DISPLAY_P3_ICC"):
+        raise FileNotFoundError(f"DISPLAY_P3_ICC={os.environ['DISPLAY_P3_ICC']} does not exist")
+    return None
+
+def _s15(*values):
+    return b"".join(struct.pack(">i", round(v * 65536)) for v in values)
+
+def _mluc(text):
+    data = text.encode("utf-16-be")
+    return b"mluc" + bytes(4) + struct.pack(">II2s2sII", 1, 12, b"en", b"US", len(data), 28) + data
+
+def build_p3_profile():
+    """ICC v4 matrix/TRC profile for Display P3 (D65, sRGB transfer curve)"""
+    tags = [
+        (b"desc", _mluc("Display P3")),
+        (b"cprt", _mluc("No copyright, use freely")),
+        (b"wtpt", b"XYZ " + bytes(4) + _s15(*D50)),
+        (b"chad", b"sf32" + bytes(4) + _s15(*CHAD)),
+        *((sig, b"XYZ " + bytes(4) + _s15(*xyz)) for sig, xyz in P3_XYZ.items()),
+    ]
+    trc = b"para" + bytes(4) + struct.pack(">HH", 3, 0) + _s15(*SRGB_TRC)
+    table, body = [], b""
+    offset = 128 + 4 + 12 * (len(tags) + 3)
+
+    def add(data):
+        nonlocal body
+        start = offset + len(body)
+        body += data + bytes(-len(data) % 4)
+        return start
+
+    for sig, data in tags:
+        table.append((sig, add(data), len(data)))
+    trc_at = add(trc)
+    table += [(sig, trc_at, len(trc)) for sig in (b"rTRC", b"gTRC", b"bTRC")]
+    size = offset + len(body)
+    header = (struct.pack(">I4sI4s4s4s", size, bytes(4), 0x04300000, b"mntr", b"RGB ", b"XYZ ")
+              + struct.pack(">6H", 2024, 1, 1, 0, 0, 0) + b"acsp" + bytes(24)
+              + struct.pack(">I", 0) + _s15(*D50) + bytes(4 + 16 + 28))
+    return (header + struct.pack(">I", len(table))
+            + b"".join(struct.pack(">4sII", *entry) for entry in table) + body)
+
+def _build(space):
+    srgb = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB"))
+    if space == "srgb":
+        # Drawing values are already sRGB: tag only, no conversion
+        return None, srgb.tobytes()
+    if space == "p3":
+        path = find_p3_profile()
+        p3 = ImageCms.ImageCmsProfile(path if path else io.BytesIO(build_p3_profile()))
+        transform = ImageCms.buildTransform(
+            srgb, p3, "RGB", "RGB",
+            renderingIntent=ImageCms.Intent.RELATIVE_COLORIMETRIC)
+        return transform, p3.tobytes()
+    raise ValueError(f"unknown color space '{space}', expected one of {COLOR_SPACES}")
+
+def get_stage(space):
+    if space not in _stages:
+        _stages[space] = _build(space)
+    return _stages[space]
+
+def apply_color_space(img, space):
+    """Convert an RGB render in place and return the ICC profile to embed"""
+    transform, icc = get_stage(space)
+    if transform is not None:
+        ImageCms.applyTransform(img, transform, inPlace=True)
+    return icc
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Build a labeled contact sheet, thumbnail pyramid and HTML gallery for review"""
+
+import argparse
+import html
+import io
+import math
+import os
+
+from PIL import Image, ImageCms, ImageDraw, ImageFont
+
+from validate_appstore import find_images
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Box-downsampling factors written to thumbs/<factor>/; the last one feeds the sheet
+LEVELS = (2, 4, 8, 16)
+# Pyramid level shown in the gallery grid (higher-res levels go in srcset)
+GALLERY_LEVEL = 8
+
+BG = (13, 15, 28)
+TEXT = (255, 255, 255)
+TEXT_SEC = (156, 163, 175)
+PAD = 16
+LABEL_H = 36
+
+def label_font(size):
+    for p in ["/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"]:
+        if os.path.exists(p):
+            return ImageFont.truetype(p, size)
+    return ImageFont.load_default()
+
+def thumb_name(rel):
+    return os.path.splitext(rel)[0] + ".png"
+
+class ContactSheet:
+    """Collects screens as they are rendered (or read back) and writes review assets.
+
+    Only the smallest pyramid level is kept in memory; every other level is
+    written to disk as soon as it is produced.
+    """
+
+    def __init__(self, root=HERE, out=None, columns=6):
+        self.root = root
+        self.out = out or os.path.join(root, "review")
+        self.columns = columns
+        self.entries = []  # (relative path, smallest thumbnail, ICC profile or None)
+
+    def add(self, img, path):
+        rel = os.path.relpath(path, self.root).replace(os.sep, "/")
+        icc = img.info.get("icc_profile")
+        level = img if img.mode == "RGB" else img.convert("RGB")
+        prev = 1
+        for factor in LEVELS:
+            level = level.reduce(factor // prev)
+            prev = factor
+            dest = os.path.join(self.out, "thumbs", str(factor), thumb_name(rel))
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            level.save(dest, "PNG", **({"icc_profile": icc} if icc else {}))
+        self.entries.append((rel, level, icc))
+
+    # Usable directly as a generator post-render hook: hook(img, path)
+    __call__ = add
+
+    def add_file(self, path):
+        with Image.open(path) as im:
+            self.add(im.convert("RGB"), path)
+
+    def sheet_profile(self, entries):
+        """Profile for the composed sheet; converts thumbnails to sRGB if they disagree"""
+        profiles = {icc for _, _, icc in entries}
+        if len(profiles) == 1:
+            return profiles.pop()
+        srgb = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB"))
+        for i, (rel, thumb, icc) in enumerate(entries):
+            if icc is not None:
+                src = ImageCms.ImageCmsProfile(io.BytesIO(icc))
+                entries[i] = (rel, ImageCms.profileToProfile(thumb, src, srgb), None)
+        return srgb.tobytes()
+
+    def write_sheet(self):
+        entries = sorted(self.entries, key=lambda e: e[0])
+        icc = self.sheet_profile(entries)
+        tw = max(t.width for _, t, _ in entries)
+        th = max(t.height for _, t, _ in entries)
+        cols = min(self.columns, len(entries))
+        rows = math.ceil(len(entries) / cols)
+        cell_w, cell_h = tw + PAD, th + LABEL_H + PAD
+        sheet = Image.new("RGB", (PAD + cols * cell_w, PAD + rows * cell_h), BG)
+        draw = ImageDraw.Draw(sheet)
+        font = label_font(12)
+        for i, (rel, thumb, _) in enumerate(entries):
+            x = PAD + (i % cols) * cell_w
+            y = PAD + (i // cols) * cell_h
+            sheet.paste(thumb, (x, y))
+            folder, name = os.path.split(rel)
+            draw.text((x, y + th + 4), os.path.splitext(name)[0], fill=TEXT, font=font)
+            draw.text((x, y + th + 20), folder, fill=TEXT_SEC, font=font)
+        path = os.path.join(self.out, "contact_sheet.png")
+        sheet.save(path, "PNG", **({"icc_profile": icc} if icc else {}))
+        return path
+
+    def write_gallery(self):
+        srcset_levels = [f for f in LEVELS if f <= GALLERY_LEVEL]
+        items = []
+        for rel, _, _ in sorted(self.entries, key=lambda e: e[0]):
+            thumb = html.escape(thumb_name(rel))
+            srcset = ", ".join(f"thumbs/{f}/{thumb} {GALLERY_LEVEL // f}x" for f in srcset_levels)
+            href = html.escape(os.path.relpath(os.path.join(self.root, rel), self.out).replace(os.sep, "/"))
+            items.append(
+                f'<figure><a href="{href}"><img src="thumbs/{GALLERY_LEVEL}/{thumb}" '
+                f'srcset="{srcset}" loading="lazy" alt="{html.escape(rel)}"></a>'
+                f"<figcaption>{html.escape(rel)}</figcaption></figure>")
+        page = (
+            "<!doctype html>\n<meta charset=\"utf-8\">\n<title>Screenshot review</title>\n"
+            "<style>body{background:#0d0f1c;color:#fff;font-family:sans-serif;"
+            "display:flex;flex-wrap:wrap;gap:16px;padding:16px}"
+            "figure{margin:0}figcaption{color:#9ca3af;font-size:12px}</style>\n"
+            '<p><a href="contact_sheet.png">Contact sheet</a></p>\n'
+            + "\n".join(items) + "\n")
+        path = os.path.join(self.out, "index.html")
+        with open(path, "w") as f:
+            f.write(page)
+        return path
+
+    def write(self):
+        if not self.entries:
+            return None
+        os.makedirs(self.out, exist_ok=True)
+        self.write_gallery()
+        return self.write_sheet()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("root", nargs="?", default=HERE, help="directory of rendered PNGs (default: screenshots/)")
+    parser.add_argument("--out", help="output directory (default: <root>/review)")
+    parser.add_argument("--columns", type=int, default=6)
+    args = parser.parse_args()
+
+    sheet = ContactSheet(args.root, args.out, args.columns)
+    out = os.path.abspath(sheet.out)
+    for path in sorted(find_images(args.root)):
+        if os.path.commonpath([os.path.abspath(path), out]) != out:
+            sheet.add_file(path)
+    if sheet.entries:
+        print(f"Contact sheet: {sheet.write()} ({len(sheet.entries)} screens)")
+    else:
+        print(f"No images found under {args.root}")
@@ -4,6 +4,13 @@
 from PIL import Image, ImageDraw, ImageFont
 import os
 
+import lottie_render
+
+try:
+    import color_manage
+except ImportError:  # ImageCms needs Pillow built with LittleCMS
+    color_manage = None
+
 W, H = 2048, 2732
 OUT = os.path.dirname(os.path.abspath(__file__)) + "/ipad"
 os.makedirs(OUT, exist_ok=True)
@@ -91,6 +98,24 @@ def draw_tab_bar(draw, active=0):
         tw = bbox[2] - bbox[0]
         draw.text((cx - tw//2, y + 75), tab, fill=color, font=font_label)
 
+# Callables run after every screen is written, as hook(img, path).
+POST_RENDER_HOOKS = []
+# Output color space ("srgb" or "p3"); None writes untagged RGB.
+COLOR_SPACE = None
+# Frame of the bundled Lottie animations to draw; None keeps the placeholders.
+LOTTIE_FRAME = None
+
+def save_screen(img, name):
+    path = f"{OUT}/{name}"
+    params = {}
+    if COLOR_SPACE is not None:
+        # Kept in img.info so hooks writing derived images can tag them too
+        img.info["icc_profile"] = params["icc_profile"] = color_manage.apply_color_space(img, COLOR_SPACE)
+    img.save(path, "PNG", **params)
+    print(f"  {name}")
+    for hook in POST_RENDER_HOOKS:
+        hook(img, path)
+
 # ============================================================
 # SCREENSHOT 1: Dashboard / Home
 # ============================================================
@@ -214,8 +239,7 @@ def screen_dashboard():
     # Tab bar
     draw_tab_bar(draw, active=0)
 
-    img.save(f"{OUT}/01_dashboard.png", "PNG")
-    print("  01_dashboard.png")
+    save_screen(img, "01_dashboard.png")
 
 # ============================================================
 # SCREENSHOT 2: Tools Screen
@@ -308,8 +332,7 @@ def screen_tools():
         gradient_rect(img, (x+2, y+430, x+col_w-2, y+448), color, (*[min(255, c+40) for c in color],))
 
     draw_tab_bar(draw, active=1)
-    img.save(f"{OUT}/02_tools.png", "PNG")
-    print("  02_tools.png")
+    save_screen(img, "02_tools.png")
 
 # ============================================================
 # SCREENSHOT 3: AI Chat
@@ -340,7 +363,10 @@ def screen_chat():
         if role == "bot":
             # Bot avatar
             draw.ellipse((80, y, 140, y+60), fill=PRIMARY)
-            draw.text((98, y+10), "AI", fill=WHITE, font=try_font(24))
+            if LOTTIE_FRAME is None:
+                draw.text((98, y+10), "AI", fill=WHITE, font=try_font(24))
+            else:
+                lottie_render.draw_animation(img, "ai-robot", (80, y, 140, y+60), LOTTIE_FRAME)
             # Message bubble
             max_w = W - 260
             rounded_rect(draw, (160, y, 160+max_w, y + max(80, len(text)//3 * 10 + 60)), CARD, radius=20)
@@ -389,8 +415,7 @@ def screen_chat():
     draw.ellipse((W-160, y_input+10, W-100, y_input+70), fill=PRIMARY)
 
     draw_tab_bar(draw, active=2)
-    img.save(f"{OUT}/03_chat.png", "PNG")
-    print("  03_chat.png")
+    save_screen(img, "03_chat.png")
 
 # ============================================================
 # SCREENSHOT 4: Tool Detail (Generation)
@@ -519,8 +544,7 @@ def screen_tool_detail():
     draw.rounded_rectangle((80, y_btn, W-80, y_btn+80), radius=14, outline=None)
     draw.text((W//2-200, y_btn+18), "Generate Content", fill=WHITE, font=font_h1)
 
-    img.save(f"{OUT}/04_tool_detail.png", "PNG")
-    print("  04_tool_detail.png")
+    save_screen(img, "04_tool_detail.png")
 
 # ============================================================
 # SCREENSHOT 5: Tool Results
@@ -641,8 +665,7 @@ def screen_results():
     gradient_rect(img, (W//2+20, y_btn, W-80, y_btn+80), PRIMARY, ACCENT)
     draw.text((W*3//4-150, y_btn+18), "New Generation", fill=WHITE, font=font_h2)
 
-    img.save(f"{OUT}/05_results.png", "PNG")
-    print("  05_results.png")
+    save_screen(img, "05_results.png")
 
 # ============================================================
 # SCREENSHOT 6: Profile Screen
@@ -719,13 +742,48 @@ def screen_profile():
     draw.text((W//2-120, y+100), "MarketingTool v1.1.0", fill=TEXT_TERT, font=font_sm)
 
     draw_tab_bar(draw, active=4)
-    img.save(f"{OUT}/06_profile.png", "PNG")
-    print("  06_profile.png")
+    save_screen(img, "06_profile.png")
 
 # ============================================================
 # Generate all screenshots
 # ============================================================
 if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--validate", action="store_true",
+                        help="check each screenshot against App Store rules after rendering")
+    parser.add_argument("--color-space", choices=["srgb", "p3"],
+                        help="embed an ICC profile, converting to Display P3 for 'p3' "
+                             "(uses $DISPLAY_P3_ICC or a system profile if present, else a built-in one)")
+    parser.add_argument("--contact-sheet", action="store_true",
+                        help="write a contact sheet, thumbnail pyramid and HTML gallery to review/")
+    parser.add_argument("--lottie-frame", type=int,
+                        help="draw this frame of src/assets/animations instead of placeholder avatars")
+    args = parser.parse_args()
+    COLOR_SPACE = args.color_space
+    LOTTIE_FRAME = args.lottie_frame
+    if LOTTIE_FRAME is not None:
+        robot = lottie_render.load_animation("ai-robot")
+        if not robot.ip <= LOTTIE_FRAME < robot.op:
+            parser.error(f"--lottie-frame must be in [{robot.ip}, {robot.op}) for ai-robot")
+    if COLOR_SPACE is not None:
+        if color_manage is None:
+            parser.error("--color-space needs Pillow built with ImageCms (LittleCMS)")
+        try:
+            color_manage.get_stage(COLOR_SPACE)  # fail early on a bad profile
+        except (OSError, color_manage.ImageCms.PyCMSError) as e:
+            parser.error(f"cannot load the {COLOR_SPACE} ICC profile: {e}")
+
+    if args.validate:
+        import validate_appstore
+        POST_RENDER_HOOKS.append(validate_appstore.post_render_hook)
+    if args.contact_sheet:
+        from contact_sheet import ContactSheet
+        sheet = ContactSheet(os.path.dirname(OUT))
+        POST_RENDER_HOOKS.append(sheet)
+
     print("Generating iPad 13\" screenshots (2048x2732px)...")
     screen_dashboard()
     screen_tools()
@@ -735,3 +793,8 @@ if __name__ == "__main__":
     screen_profile()
     print(f"\nDone! Screenshots saved to {OUT}/")
     print("Resolution: 2048 x 2732px (iPad 12.9\"/13\" Display)")
+    if args.contact_sheet:
+        print(f"Contact sheet: {sheet.write()}")
+    if args.validate and validate_appstore.failures:
+        print(f"{len(validate_appstore.failures)} screenshot(s) failed App Store validation")
+        sys.exit(1)
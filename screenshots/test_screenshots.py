@@ -0,0 +1,212 @@
+"""Tests for the screenshot tooling; images are built in memory with PIL"""
+
+import io
+import math
+import os
+import struct
+import zlib
+
+import pytest
+from PIL import Image, ImageCms
+
+import color_manage
+import contact_sheet as cs
+import lottie_render as lr
+import validate_appstore as va
+
+SRGB_ICC = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes()
+
+def png_bytes(img, **params):
+    buf = io.BytesIO()
+    img.save(buf, "PNG", **params)
+    return buf.getvalue()
+
+def jpeg_bytes(img, **params):
+    buf = io.BytesIO()
+    img.save(buf, "JPEG", **params)
+    return buf.getvalue()
+
+def with_chunk(png, ctype, data):
+    """Insert a chunk right after IHDR (8-byte signature + 25-byte IHDR)"""
+    chunk = struct.pack(">I", len(data)) + ctype + data + struct.pack(">I", zlib.crc32(ctype + data))
+    return png[:33] + chunk + png[33:]
+
+# ============================================================
+# validate_appstore: PNG / JPEG headers
+# ============================================================
+def test_png_rgb_with_icc():
+    info = va.read_png_header(io.BytesIO(png_bytes(Image.new("RGB", (30, 20)), icc_profile=SRGB_ICC)))
+    assert (info["width"], info["height"], info["mode"]) == (30, 20, "RGB")
+    assert info["alpha"] is False
+    assert "sRGB" in info["profile"]
+
+def test_png_untagged_has_no_profile():
+    info = va.read_png_header(io.BytesIO(png_bytes(Image.new("RGB", (4, 4)))))
+    assert info["profile"] is None
+
+def test_png_srgb_chunk():
+    png = with_chunk(png_bytes(Image.new("RGB", (4, 4))), b"sRGB", b"\0")
+    assert va.read_png_header(io.BytesIO(png))["profile"] == "sRGB"
+
+def test_png_alpha_from_color_type_and_trns():
+    rgba = va.read_png_header(io.BytesIO(png_bytes(Image.new("RGBA", (4, 4)))))
+    assert (rgba["mode"], rgba["alpha"]) == ("RGBA", True)
+    pal = va.read_png_header(io.BytesIO(png_bytes(Image.new("P", (4, 4)), transparency=0)))
+    assert (pal["mode"], pal["alpha"]) == ("P", True)
+
+def test_png_rejects_other_formats():
+    with pytest.raises(ValueError, match="not a PNG"):
+        va.read_png_header(io.BytesIO(jpeg_bytes(Image.new("RGB", (4, 4)))))
+
+def test_jpeg_modes_and_icc():
+    info = va.read_jpeg_header(io.BytesIO(jpeg_bytes(Image.new("RGB", (33, 17)), icc_profile=SRGB_ICC)))
+    assert (info["width"], info["height"], info["mode"]) == (33, 17, "RGB")
+    assert "sRGB" in info["profile"]
+    assert va.read_jpeg_header(io.BytesIO(jpeg_bytes(Image.new("L", (4, 4)))))["mode"] == "L"
+    assert va.read_jpeg_header(io.BytesIO(jpeg_bytes(Image.new("CMYK", (4, 4)))))["mode"] == "CMYK"
+
+def test_icc_description_desc_and_mluc():
+    text = b"Test Profile\0"
+    tag = b"desc" + bytes(4) + struct.pack(">I", len(text)) + text
+    v2 = bytes(128) + struct.pack(">I4sII", 1, b"desc", 144, len(tag)) + tag
+    assert va.icc_description(v2) == "Test Profile"
+    assert va.icc_description(color_manage.build_p3_profile()) == "Display P3"
+    assert va.icc_description(b"short") is None
+
+def test_validate_tree_reports_errors(tmp_path):
+    device = tmp_path / "ipad"
+    device.mkdir()
+    Image.new("RGB", (2048, 2732)).save(device / "ok.png")
+    Image.new("RGBA", (100, 100)).save(device / "bad.png")
+    os.symlink(tmp_path / "missing.png", device / "broken.png")
+
+    results = {os.path.basename(r["path"]): r for r in va.validate_tree(str(tmp_path))}
+    assert results["ok.png"]["ok"]
+    bad = results["bad.png"]["errors"]
+    assert any("size 100x100" in e for e in bad)
+    assert "has alpha channel" in bad
+    assert results["broken.png"]["errors"][0].startswith("unreadable")
+
+# ============================================================
+# color_manage: Display P3 profile and cached transforms
+# ============================================================
+def test_built_p3_profile_loads():
+    profile = ImageCms.ImageCmsProfile(io.BytesIO(color_manage.build_p3_profile()))
+    assert ImageCms.getProfileDescription(profile).strip() == "Display P3"
+
+def test_p3_converts_in_place(monkeypatch):
+    monkeypatch.setattr(color_manage, "P3_PROFILE_PATHS", [])
+    monkeypatch.setattr(color_manage, "_stages", {})
+    img = Image.new("RGB", (2, 2), (255, 0, 0))
+    icc = color_manage.apply_color_space(img, "p3")
+    r, g, b = img.getpixel((1, 1))
+    assert abs(r - 234) <= 2 and abs(g - 51) <= 2 and abs(b - 35) <= 2
+    assert va.icc_description(icc) == "Display P3"
+
+def test_stage_built_once():
+    assert color_manage.get_stage("p3") is color_manage.get_stage("p3")
+
+def test_srgb_tags_without_converting():
+    img = Image.new("RGB", (2, 2), (108, 92, 231))
+    icc = color_manage.apply_color_space(img, "srgb")
+    assert img.getpixel((0, 0)) == (108, 92, 231)
+    assert "sRGB" in va.icc_description(icc)
+
+def test_unknown_color_space():
+    with pytest.raises(ValueError):
+        color_manage.get_stage("adobe-rgb")
+
+# ============================================================
+# contact_sheet: thumbnail pyramid and sheet profile
+# ============================================================
+P3_ICC = color_manage.build_p3_profile()
+
+def screen(icc=None):
+    img = Image.new("RGB", (2048, 2732), (108, 92, 231))
+    if icc:
+        img.info["icc_profile"] = icc
+    return img
+
+def test_pyramid_levels(tmp_path):
+    sheet = cs.ContactSheet(str(tmp_path))
+    sheet.add(screen(), str(tmp_path / "ipad" / "01_dashboard.png"))
+    for factor in cs.LEVELS:
+        with Image.open(tmp_path / "review" / "thumbs" / str(factor) / "ipad" / "01_dashboard.png") as im:
+            assert im.size == (2048 // factor, math.ceil(2732 / factor))
+    [(rel, thumb, icc)] = sheet.entries
+    assert (rel, thumb.size, icc) == ("ipad/01_dashboard.png", (128, 171), None)
+
+def test_icc_carried_to_thumbs_and_sheet(tmp_path):
+    sheet = cs.ContactSheet(str(tmp_path))
+    sheet.add(screen(P3_ICC), str(tmp_path / "ipad" / "01.png"))
+    sheet.add(screen(P3_ICC), str(tmp_path / "ipad" / "02.png"))
+    path = sheet.write()
+    for factor in cs.LEVELS:
+        with Image.open(tmp_path / "review" / "thumbs" / str(factor) / "ipad" / "01.png") as im:
+            assert im.info.get("icc_profile") == P3_ICC
+    with Image.open(path) as im:
+        assert im.info.get("icc_profile") == P3_ICC
+
+def test_mixed_profiles_give_srgb_sheet(tmp_path):
+    sheet = cs.ContactSheet(str(tmp_path))
+    sheet.add(screen(P3_ICC), str(tmp_path / "ipad" / "01.png"))
+    sheet.add(screen(), str(tmp_path / "ipad" / "02.png"))
+    with Image.open(sheet.write()) as im:
+        assert "sRGB" in va.icc_description(im.info["icc_profile"])
+
+def test_write_without_screens(tmp_path):
+    assert cs.ContactSheet(str(tmp_path)).write() is None
+
+# ============================================================
+# lottie_render: keyframe interpolation and caches
+# ============================================================
+LINEAR = {"o": {"x": 0, "y": 0}, "i": {"x": 1, "y": 1}}
+
+def close(a, b, eps=1e-3):
+    if isinstance(a, list):
+        return all(close(x, y, eps) for x, y in zip(a, b))
+    return abs(a - b) < eps
+
+def test_prop_static_and_linear():
+    assert lr.Prop({"a": 0, "k": [1, 2]})(5) == [1, 2]
+    p = lr.Prop({"a": 1, "k": [{"t": 0, "s": [0, 10], **LINEAR}, {"t": 10, "s": [100, 20]}]})
+    assert close(p(5), [50, 15])
+    assert p(-3) == [0, 10] and p(99) == [100, 20]  # clamped outside the keyframes
+    assert p(5) is p(5)  # memoized per frame
+
+def test_prop_eased_scalar():
+    p = lr.Prop({"a": 1, "k": [{"t": 0, "s": [0], "o": {"x": [0.333], "y": [0]},
+                                "i": {"x": [0.667], "y": [1]}}, {"t": 10, "s": [100]}]})
+    assert close(p(5)[0], 50, 0.5)  # symmetric ease passes through the midpoint
+    assert p(2)[0] < 20 and p(8)[0] > 80
+
+def test_prop_hold_keyframe():
+    p = lr.Prop({"a": 1, "k": [{"t": 0, "s": [1], "h": 1}, {"t": 10, "s": [2]}]})
+    assert p(9.9) == [1] and p(10) == [2]
+
+def test_prop_spatial_bezier():
+    p = lr.Prop({"a": 1, "k": [{"t": 0, "s": [0, 0], "to": [0, -30], "ti": [0, -30], **LINEAR},
+                               {"t": 10, "s": [100, 0]}]})
+    # Control points (0,-30) and (100,-30): the midpoint bulges to y = -22.5
+    assert close(p(5), [50, -22.5])
+
+def test_prop_shape_keyframes():
+    a = {"c": True, "v": [[0, 0], [10, 0]], "i": [[0, 0], [0, 0]], "o": [[0, 0], [0, 0]]}
+    b = {"c": True, "v": [[0, 10], [20, 0]], "i": [[0, 0], [0, 0]], "o": [[2, 2], [0, 0]]}
+    p = lr.Prop({"a": 1, "k": [{"t": 0, "s": [a], **LINEAR}, {"t": 4, "s": [b]}]})
+    shape = p(2)[0]
+    assert shape["c"] is True
+    assert close(shape["v"], [[0, 5], [15, 0]]) and close(shape["o"], [[1, 1], [0, 0]])
+
+def test_tessellation_cached_for_static_shapes():
+    static = lr.Ellipse({"s": {"a": 0, "k": [10, 10]}, "p": {"a": 0, "k": [0, 0]}})
+    assert static.polygons(0) is static.polygons(30)
+    moving = lr.Ellipse({"s": {"a": 1, "k": [{"t": 0, "s": [10, 10], **LINEAR}, {"t": 10, "s": [20, 20]}]},
+                         "p": {"a": 0, "k": [0, 0]}})
+    assert moving.polygons(3) is moving.polygons(3)
+    assert moving.polygons(3) is not moving.polygons(4)
+
+def test_render_frame_returns_private_copy():
+    first = lr.render_frame("loading-dots", 0, (50, 20))
+    first.paste((0, 0, 0, 0), (0, 0) + first.size)
+    assert lr.render_frame("loading-dots", 0, (50, 20)).getbbox() is not None
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Validate App Store screenshots from PNG/JPEG headers (no pixel decoding)"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Accepted pixel sizes per device folder (portrait, landscape), per App Store Connect
+DEVICE_SIZES = {
+    "ipad": [(2048, 2732), (2732, 2048), (2064, 2752), (2752, 2064)],    # 13" / 12.9"
+    "ipad_11": [(1668, 2388), (2388, 1668), (1640, 2360), (2360, 1640),
+                (1668, 2420), (2420, 1668), (1488, 2266), (2266, 1488)],  # 11"
+    "iphone_69": [(1320, 2868), (2868, 1320), (1290, 2796), (2796, 1290)],  # 6.9"
+    "iphone_67": [(1290, 2796), (2796, 1290)],                            # 6.7"
+    "iphone_65": [(1242, 2688), (2688, 1242), (1284, 2778), (2778, 1284)],  # 6.5"
+}
+MAX_BYTES = 10 * 1024 * 1024
+ACCEPTED_MODES = ("RGB", "P")
+ACCEPTED_PROFILES = ("sRGB", "Display P3")
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+# Generated review assets (contact_sheet.py), not upload candidates
+SKIP_DIRS = {"review"}
+
+PNG_SIG = b"\x89PNG\r\n\x1a\n"
+PNG_MODES = {0: "L", 2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}
+JPEG_MODES = {1: "L", 3: "RGB", 4: "CMYK"}
+# SOF0-SOF15, minus DHT (C4), JPG (C8) and DAC (CC)
+JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+# Collected by post_render_hook so the generator can fail the run
+failures = []
+
+def icc_description(profile):
+    """Return the 'desc' tag text of an ICC profile, or None"""
+    try:
+        count = struct.unpack(">I", profile[128:132])[0]
+        for i in range(count):
+            sig, start, size = struct.unpack(">4sII", profile[132 + 12*i:144 + 12*i])
+            if sig != b"desc":
+                continue
+            tag = profile[start:start + size]
+            if tag[:4] == b"desc":
+                n = struct.unpack(">I", tag[8:12])[0]
+                return tag[12:12 + n].rstrip(b"\0").decode("latin-1")
+            if tag[:4] == b"mluc":
+                nrec = struct.unpack(">I", tag[8:12])[0]
+                if nrec:
+                    length, offset = struct.unpack(">II", tag[20:28])
+                    return tag[offset:offset + length].decode("utf-16-be")
+    except (struct.error, UnicodeDecodeError):
+        pass
+    return None
+
+def read_png_header(f):
+    if f.read(8) != PNG_SIG:
+        raise ValueError("not a PNG file")
+    info = {"format": "PNG", "alpha": False, "profile": None}
+    while True:
+        head = f.read(8)
+        if len(head) < 8:
+            raise ValueError("truncated PNG")
+        length, ctype = struct.unpack(">I4s", head)
+        if ctype in (b"IDAT", b"IEND"):
+            break
+        if ctype == b"IHDR":
+            w, h, _depth, color_type = struct.unpack(">IIBB", f.read(length)[:10])
+            info.update(width=w, height=h, mode=PNG_MODES.get(color_type, str(color_type)))
+            info["alpha"] = color_type in (4, 6)
+        elif ctype == b"iCCP":
+            name, _, rest = f.read(length).partition(b"\0")
+            try:
+                desc = icc_description(zlib.decompress(rest[1:]))
+            except zlib.error:
+                desc = None
+            info["profile"] = desc or name.decode("latin-1")
+        elif ctype == b"sRGB":
+            info["profile"] = "sRGB"
+            f.seek(length, 1)
+        elif ctype == b"tRNS":
+            info["alpha"] = True
+            f.seek(length, 1)
+        else:
+            f.seek(length, 1)
+        f.seek(4, 1)  # CRC
+    if "width" not in info:
+        raise ValueError("PNG without IHDR")
+    return info
+
+def read_jpeg_header(f):
+    if f.read(2) != b"\xff\xd8":
+        raise ValueError("not a JPEG file")
+    info = {"format": "JPEG", "alpha": False, "profile": None}
+    icc = {}
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise ValueError("truncated JPEG")
+        if byte != b"\xff":
+            continue
+        marker = f.read(1)
+        while marker == b"\xff":
+            marker = f.read(1)
+        if not marker:
+            raise ValueError("truncated JPEG")
+        marker = marker[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            continue
+        if marker in (0xD9, 0xDA):  # EOI / start of scan: headers are done
+            break
+        length = struct.unpack(">H", f.read(2))[0]
+        if marker in JPEG_SOF:
+            _precision, h, w, components = struct.unpack(">BHHB", f.read(length - 2)[:6])
+            info.update(width=w, height=h, mode=JPEG_MODES.get(components, str(components)))
+        elif marker == 0xE2:
+            data = f.read(length - 2)
+            if data.startswith(b"ICC_PROFILE\0"):
+                icc[data[12]] = data[14:]
+        else:
+            f.seek(length - 2, 1)
+    if "width" not in info:
+        raise ValueError("JPEG without SOF")
+    if icc:
+        info["profile"] = icc_description(b"".join(icc[k] for k in sorted(icc))) or "unknown"
+    return info
+
+def validate_file(path, sizes=None, max_bytes=MAX_BYTES):
+    """Check one image against App Store Connect rules; returns a report dict"""
+    device = os.path.basename(os.path.dirname(os.path.abspath(path)))
+    if sizes is None:
+        sizes = DEVICE_SIZES.get(device)
+    result = {"path": path, "device": device, "bytes": None, "errors": []}
+    errors = result["errors"]
+    try:
+        result["bytes"] = os.path.getsize(path)
+        with open(path, "rb") as f:
+            if path.lower().endswith(".png"):
+                result.update(read_png_header(f))
+            else:
+                result.update(read_jpeg_header(f))
+    except (OSError, ValueError, struct.error) as e:
+        errors.append(f"unreadable: {e}")
+        result["ok"] = False
+        return result
+
+    if sizes is None:
+        errors.append(f"no required size known for device '{device}'")
+    elif (result["width"], result["height"]) not in [tuple(s) for s in sizes]:
+        want = " or ".join(f"{w}x{h}" for w, h in sizes)
+        errors.append(f"size {result['width']}x{result['height']}, expected {want}")
+    if result["alpha"]:
+        errors.append("has alpha channel")
+    if result["mode"] not in ACCEPTED_MODES:
+        errors.append(f"color type {result['mode']} not accepted")
+    profile = result["profile"]
+    if profile is not None and not any(p.lower() in profile.lower() for p in ACCEPTED_PROFILES):
+        errors.append(f"color profile '{profile}' not accepted")
+    if result["bytes"] > max_bytes:
+        errors.append(f"file is {result['bytes']} bytes, limit {max_bytes}")
+    result["ok"] = not errors
+    return result
+
+def find_images(root):
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in sorted(files):
+            if name.lower().endswith(IMAGE_EXTS):
+                yield os.path.join(dirpath, name)
+
+def validate_tree(root, sizes=None, max_bytes=MAX_BYTES, workers=None):
+    """Validate every image under root in parallel; returns reports in path order"""
+    paths = sorted(find_images(root))
+    # Header reads are I/O bound, so threads are enough
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda p: validate_file(p, sizes, max_bytes), paths))
+
+def post_render_hook(img, path):
+    """Generator hook: validate each screenshot right after it is written"""
+    result = validate_file(path)
+    if not result["ok"]:
+        failures.append(result)
+        for err in result["errors"]:
+            print(f"    ! {err}")
+
+def parse_size(text):
+    w, _, h = text.lower().partition("x")
+    return int(w), int(h)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("root", nargs="?", default=HERE, help="directory to scan (default: screenshots/)")
+    parser.add_argument("--size", type=parse_size, action="append",
+                        help="required WxH, overrides per-device sizes (repeatable)")
+    parser.add_argument("--max-bytes", type=int, default=MAX_BYTES)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--report", default="-", help="JSON report path ('-' for stdout)")
+    args = parser.parse_args()
+
+    results = validate_tree(args.root, args.size, args.max_bytes, args.workers)
+    for r in results:
+        r["path"] = os.path.relpath(r["path"], args.root)
+    failed = [r for r in results if not r["ok"]]
+    report = json.dumps({"checked": len(results), "failed": len(failed), "files": results}, indent=2)
+    if args.report == "-":
+        print(report)
+    else:
+        with open(args.report, "w") as f:
+            f.write(report + "\n")
+        print(f"Checked {len(results)} files, {len(failed)} failed. Report: {args.report}")
+    sys.exit(1 if failed else 0)